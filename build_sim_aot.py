@@ -0,0 +1,22 @@
+"""
+Build script for an ahead-of-time compiled copy of the season kernel.
+
+Running `python build_sim_aot.py` produces a `_sim_aot` extension module
+in this directory. The main script imports `simulate_season` from it
+when present, skipping JIT warmup entirely for repeated invocations
+(e.g. parameter sweeps); without the extension it falls back to the
+@njit kernel, which still caches compiled code after the first run.
+"""
+from numba.pycc import CC
+
+import SOSPreseasonBiasFull134StandardCommittee100Runs as sim
+
+cc = CC('_sim_aot')
+
+# Same contract as the JIT kernel: fill the preallocated rank-history
+# and stats matrices for one seeded season.
+cc.export('simulate_season',
+          'void(i4, i4, i8, i2[:,:], f8[:,:])')(sim._simulate_season_nb.py_func)
+
+if __name__ == '__main__':
+    cc.compile()